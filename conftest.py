@@ -1,9 +1,39 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+import pytest
+import tempfile
+
 
 def pytest_configure(config):
+    worker = os.environ.get("PYTEST_XDIST_WORKER", None)
+    if worker is not None:
+        # Running as a pytest-xdist worker. Use separate Firedrake kernel
+        # caches for each worker, to avoid cache lock contention. Set before
+        # any test module imports Firedrake.
+        cache_root = os.path.join(tempfile.gettempdir(),
+                                  f"tlm_adjoint-{worker:s}")
+        os.environ.setdefault("PYOP2_CACHE_DIR",
+                              os.path.join(cache_root, "pyop2"))
+        os.environ.setdefault("FIREDRAKE_TSFC_KERNEL_CACHE_DIR",
+                              os.path.join(cache_root, "tsfc"))
+
     config.addinivalue_line("markers", "example: example scripts")
     config.addinivalue_line("markers", "fenics: FEniCS tests")
     config.addinivalue_line("markers", "firedrake: Firedrake tests")
     config.addinivalue_line("markers", "numpy: NumPy tests")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def xdist_worker_directory(tmp_path_factory):
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        # Run each pytest-xdist worker in its own working directory, so that
+        # checkpoint and storage files written to relative paths are not
+        # shared between workers
+        cwd = os.getcwd()
+        os.chdir(tmp_path_factory.mktemp("worker"))
+        yield
+        os.chdir(cwd)
+    else:
+        yield
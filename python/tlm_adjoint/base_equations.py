@@ -646,10 +646,13 @@ class FunctionalMarker(Equation):
 
 
 def get_tangent_linear(x, M, dM, tlm_map):
-    try:
-        return dM[M.index(x)]
-    except ValueError:
-        return tlm_map[x]
+    # Match on function IDs, avoiding (possibly expensive) function equality
+    # comparisons
+    x_id = function_id(x)
+    for m, dm in zip(M, dM):
+        if function_id(m) == x_id:
+            return dm
+    return tlm_map[x]
 
 
 class NullSolver(Equation):
@@ -1189,6 +1192,8 @@ class LinearEquation(Equation):
     def __init__(self, B, X, A=None):
         if isinstance(B, RHS):
             B = (B,)
+        else:
+            B = tuple(B)
         if is_function(X):
             X = (X,)
 
@@ -1225,9 +1230,12 @@ class LinearEquation(Equation):
                     nl_dep_ids[dep_id] = len(nl_deps) - 1
                 b_nl_dep_indices[i].append(nl_dep_ids[dep_id])
 
-        b_dep_ids = tuple({function_id(b_dep): i
-                           for i, b_dep in enumerate(b.dependencies())}
-                          for b in B)
+        # Maps from equation dependency indices to right-hand-side term
+        # dependency indices
+        b_dep_index_maps = tuple({dep_index: b_dep_index
+                                  for b_dep_index, dep_index
+                                  in enumerate(b_dep_indices[i])}
+                                 for i in range(len(B)))
 
         if A is not None:
             A_dep_indices = []
@@ -1262,10 +1270,10 @@ class LinearEquation(Equation):
             X, deps, nl_deps=nl_deps,
             ic=A is not None and A.has_initial_condition(),
             adj_ic=A is not None and A.adjoint_has_initial_condition())
-        self._B = tuple(B)
+        self._B = B
         self._b_dep_indices = b_dep_indices
         self._b_nl_dep_indices = b_nl_dep_indices
-        self._b_dep_ids = b_dep_ids
+        self._b_dep_index_maps = b_dep_index_maps
         self._A = A
         if A is not None:
             self._A_dep_indices = A_dep_indices
@@ -1282,11 +1290,21 @@ class LinearEquation(Equation):
             self._A.replace(replace_map)
 
     def forward_solve(self, X, deps=None):
-        if is_function(X):
-            X = (X,)
         if deps is None:
             deps = self.dependencies()
 
+        if self._A is None and len(self._B) == 1:
+            # Fast path for the common case of a single right-hand-side term
+            # and no matrix
+            if not is_function(X) and len(X) == 1:
+                X = X[0]
+            self._B[0].add_forward(X,
+                                   [deps[j] for j in self._b_dep_indices[0]])
+            return
+
+        if is_function(X):
+            X = (X,)
+
         if self._A is None:
             B = X
         else:
@@ -1348,10 +1366,9 @@ class LinearEquation(Equation):
             dep = eq_deps[dep_index]
             dep_id = function_id(dep)
             F = function_new(dep)
-            for i, (b, b_dep_ids) in enumerate(zip(self._B, self._b_dep_ids)):
-                try:
-                    b_dep_index = b_dep_ids[dep_id]
-                except KeyError:
+            for i, b in enumerate(self._B):
+                b_dep_index = self._b_dep_index_maps[i].get(dep_index, None)
+                if b_dep_index is None:
                     continue
                 b_nl_deps = [nl_deps[j] for j in self._b_nl_dep_indices[i]]
                 b.subtract_adjoint_derivative_action(
@@ -1637,18 +1654,22 @@ class MatrixActionRHS(RHS):
 
         self._A = A
         self._x_indices = x_indices
+        self._x_dep_indices = tuple(x_indices.keys())
+        self._N_A_nl_deps = len(A_nl_deps)
 
     def replace(self, replace_map):
         super().replace(replace_map)
         self._A.replace(replace_map)
 
     def add_forward(self, B, deps):
-        if is_function(B):
-            B = (B,)
-        X = [deps[j] for j in self._x_indices]
-        self._A.forward_action(deps[:len(self._A.nonlinear_dependencies())],
-                               X[0] if len(X) == 1 else X,
-                               B[0] if len(B) == 1 else B,
+        if not is_function(B) and len(B) == 1:
+            B = B[0]
+        x_dep_indices = self._x_dep_indices
+        if len(x_dep_indices) == 1:
+            X = deps[x_dep_indices[0]]
+        else:
+            X = [deps[j] for j in x_dep_indices]
+        self._A.forward_action(deps[:self._N_A_nl_deps], X, B,
                                method="add")
 
     def subtract_adjoint_derivative_action(self, nl_deps, dep_index, adj_X, b):
@@ -1656,9 +1677,9 @@ class MatrixActionRHS(RHS):
             adj_X = (adj_X,)
         if dep_index < 0 or dep_index >= len(self.dependencies()):
             raise EquationException("dep_index out of bounds")
-        N_A_nl_deps = len(self._A.nonlinear_dependencies())
+        N_A_nl_deps = self._N_A_nl_deps
         if dep_index < N_A_nl_deps:
-            X = [nl_deps[j] for j in self._x_indices]
+            X = [nl_deps[j] for j in self._x_dep_indices]
             self._A.adjoint_derivative_action(
                 nl_deps[:N_A_nl_deps], dep_index,
                 X[0] if len(X) == 1 else X,
@@ -1672,9 +1693,9 @@ class MatrixActionRHS(RHS):
 
     def tangent_linear_rhs(self, M, dM, tlm_map):
         deps = self.dependencies()
-        N_A_nl_deps = len(self._A.nonlinear_dependencies())
+        N_A_nl_deps = self._N_A_nl_deps
 
-        X = [deps[j] for j in self._x_indices]
+        X = [deps[j] for j in self._x_dep_indices]
         tlm_X = tuple(get_tangent_linear(x, M, dM, tlm_map) for x in X)
         tlm_B = [MatrixActionRHS(self._A, tlm_X)]
 
@@ -56,58 +56,72 @@ class TimesteppingException(Exception):
     pass
 
 
+# Orders of the time level types, defining their ordering relative to each
+# other
+_INITIAL_TIME_LEVEL_ORDER = -1
+_TIME_LEVEL_ORDER = 0
+_FINAL_TIME_LEVEL_ORDER = 1
+
+
 class BaseTimeLevel:
+    __slots__ = ("_order", "_i", "_key", "_hash")
+
     def __init__(self, order, i):
         self._order = order
         self._i = i
+        # Comparisons and hashing use a precomputed (order, i) key, so that
+        # sorting time levels reduces to native tuple comparisons
+        self._key = (order, i)
+        self._hash = hash(self._key)
 
     def __hash__(self):
-        return hash((self._order, self._i))
+        return self._hash
 
     def __eq__(self, other):
         if isinstance(other, BaseTimeLevel):
-            return self._order == other._order and self._i == other._i
+            return self._key == other._key
+        else:
+            return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, BaseTimeLevel):
+            return self._key != other._key
         else:
             return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, BaseTimeLevel):
-            if self._order < other._order:
-                return True
-            elif self._order > other._order:
-                return False
-            else:
-                return self._i < other._i
+            return self._key < other._key
         else:
             return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, BaseTimeLevel):
-            if self._order > other._order:
-                return True
-            elif self._order < other._order:
-                return False
-            else:
-                return self._i > other._i
+            return self._key > other._key
         else:
             return NotImplemented
 
-    def __ne__(self, other):
-        return not self == other
-
     def __le__(self, other):
-        return not self > other
+        if isinstance(other, BaseTimeLevel):
+            return self._key <= other._key
+        else:
+            return NotImplemented
 
     def __ge__(self, other):
-        return not self < other
+        if isinstance(other, BaseTimeLevel):
+            return self._key >= other._key
+        else:
+            return NotImplemented
 
     def i(self):
         return self._i
 
 
 class InitialTimeLevel(BaseTimeLevel):
+    __slots__ = ()
+
     def __init__(self, i=0):
-        super().__init__(order=-1, i=i)
+        super().__init__(order=_INITIAL_TIME_LEVEL_ORDER, i=i)
 
     def __add__(self, other):
         return InitialTimeLevel(self._i + other)
@@ -117,8 +131,10 @@ class InitialTimeLevel(BaseTimeLevel):
 
 
 class TimeLevel(BaseTimeLevel):
+    __slots__ = ()
+
     def __init__(self, i=0):
-        super().__init__(order=0, i=i)
+        super().__init__(order=_TIME_LEVEL_ORDER, i=i)
 
     def __add__(self, other):
         return TimeLevel(self._i + other)
@@ -128,8 +144,10 @@ class TimeLevel(BaseTimeLevel):
 
 
 class FinalTimeLevel(BaseTimeLevel):
+    __slots__ = ()
+
     def __init__(self, i=0):
-        super().__init__(order=1, i=i)
+        super().__init__(order=_FINAL_TIME_LEVEL_ORDER, i=i)
 
     def __add__(self, other):
         return FinalTimeLevel(self._i + other)
@@ -143,10 +161,13 @@ N = FinalTimeLevel()
 
 
 class TimeLevels:
+    __slots__ = ("_levels", "_cycle_map")
+
     def __init__(self, levels, cycle_map):
         levels = tuple(sorted(set(levels)))
         # Always assign to earlier time levels first in the cycle
-        cycle_map = OrderedDict(sorted(cycle_map.items(), key=lambda i: i[0]))
+        cycle_map = OrderedDict(sorted(cycle_map.items(),
+                                       key=lambda i: i[0]._key))
 
         self._levels = levels
         self._cycle_map = cycle_map
@@ -189,22 +210,24 @@ class Alias:
 
 class TimeFunction:
     def __init__(self, levels, *args, cls=Function, **kwargs):
-        # Note that this keeps references to the functions on each time level
+        # Note that this keeps references to the functions on each time level.
+        # Functions are keyed by the (order, i) time level key, so that
+        # integer keys can be looked up without constructing a time level.
         self._fns = {}
         for level in levels:
             fn = cls(*args, **kwargs)
             fn._tlm_adjoint__tfn = self
             fn._tlm_adjoint__level = level
-            self._fns[level] = fn
+            self._fns[level._key] = fn
 
             initial_level = InitialTimeLevel(level.i())
-            initial_fn = self._fns[initial_level] = Alias(fn)
+            initial_fn = self._fns[initial_level._key] = Alias(fn)
             super(Alias, initial_fn).__setattr__("_tlm_adjoint__tfn", self)
             super(Alias, initial_fn).__setattr__("_tlm_adjoint__level",
                                                  initial_level)
 
             final_level = FinalTimeLevel(level.i())
-            final_fn = self._fns[final_level] = Alias(fn)
+            final_fn = self._fns[final_level._key] = Alias(fn)
             super(Alias, final_fn).__setattr__("_tlm_adjoint__tfn", self)
             super(Alias, final_fn).__setattr__("_tlm_adjoint__level",
                                                final_level)
@@ -214,9 +237,10 @@ class TimeFunction:
 
     def __getitem__(self, level):
         if isinstance(level, BaseTimeLevel):
-            return self._fns[level]
+            return self._fns[level._key]
         else:
-            return self._fns[InitialTimeLevel(level)]
+            # Integer levels index initial time levels
+            return self._fns[(_INITIAL_TIME_LEVEL_ORDER, level)]
 
     def __len__(self):
         return len(self._fns)
@@ -713,8 +713,7 @@ class EquationManager:
             cp_parameters["format"] = cp_parameters.get("format", "hdf5")
 
             if self._comm.rank == 0:
-                if not os.path.exists(cp_path):
-                    os.makedirs(cp_path)
+                os.makedirs(cp_path, exist_ok=True)
             self._comm.barrier()
 
         if cp_method == "memory":
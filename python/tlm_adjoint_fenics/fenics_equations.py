@@ -258,9 +258,9 @@ def interpolation_matrix(x_coords, y, y_cells, y_colors):
     for y_node, color in enumerate(y_colors):
         y_nodes[color].append(y_node)
 
-    from scipy.sparse import dok_matrix
-    P = dok_matrix((x_coords.shape[0], function_local_size(y)),
-                   dtype=np.float64)
+    P_i = []
+    P_j = []
+    P_x = []
 
     y_v = function_new(y)
     x_v = np.empty((1,), dtype=np.float64)
@@ -277,10 +277,19 @@ def interpolation_matrix(x_coords, y, y_cells, y_colors):
                 continue
             y_node = y_cell_nodes[i]
             y_v.eval_cell(x_v, x_coords[x_node, :], Cell(y_mesh, y_cell))
-            P[x_node, y_node] = x_v[0]
+            P_i.append(x_node)
+            P_j.append(y_node)
+            P_x.append(x_v[0])
         y_v.vector()[y_color_nodes] = 0.0
 
-    return P.tocsr()
+    from scipy.sparse import coo_matrix
+    P = coo_matrix((np.array(P_x, dtype=np.float64),
+                    (np.array(P_i, dtype=np.int64),
+                     np.array(P_j, dtype=np.int64))),
+                   shape=(x_coords.shape[0], function_local_size(y)))
+    P = P.tocsr()
+    P.eliminate_zeros()
+    return P
 
 
 class InterpolationSolver(LinearEquation):
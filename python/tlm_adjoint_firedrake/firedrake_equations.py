@@ -192,8 +192,9 @@ def interpolation_matrix(x_coords, y, y_nodes):
     lg_map = function_space(y).local_to_global_map([]).indices
     gl_map = {g: l for l, g in enumerate(lg_map)}
 
-    from scipy.sparse import dok_matrix
-    P = dok_matrix((x_coords.shape[0], N), dtype=np.float64)
+    P_i = []
+    P_j = []
+    P_x = []
 
     y_v = function_new(y)
     for x_node, x_coord in enumerate(x_coords):
@@ -206,13 +207,22 @@ def interpolation_matrix(x_coords, y, y_nodes):
             if y_node in gl_map:
                 y_node_local = gl_map[y_node]
                 if y_node_local < N:
-                    P[x_node, y_node_local] = x_v
+                    P_i.append(x_node)
+                    P_j.append(y_node_local)
+                    P_x.append(x_v)
             with y_v.dat.vec as y_v_v:
                 y_v_v.setValue(y_node, 0.0)
                 y_v_v.assemblyBegin()
                 y_v_v.assemblyEnd()
 
-    return P.tocsr()
+    from scipy.sparse import coo_matrix
+    P = coo_matrix((np.array(P_x, dtype=np.float64),
+                    (np.array(P_i, dtype=np.int64),
+                     np.array(P_j, dtype=np.int64))),
+                   shape=(x_coords.shape[0], N))
+    P = P.tocsr()
+    P.eliminate_zeros()
+    return P
 
 
 class PointInterpolationSolver(Equation):
@@ -261,8 +271,7 @@ class PointInterpolationSolver(Equation):
                 if y_cell is None or y_cell >= y_cell_node_graph.shape[0]:
                     y_nodes_local[i, :] = -1
                 else:
-                    for j, y_node in enumerate(y_cell_node_graph[y_cell, :]):
-                        y_nodes_local[i, j] = lg_map[y_node]
+                    y_nodes_local[i, :] = lg_map[y_cell_node_graph[y_cell, :]]
 
             y_nodes = np.empty(y_nodes_local.shape, dtype=np.int64)
             comm = function_comm(y)
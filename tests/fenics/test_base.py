@@ -116,12 +116,21 @@ _Function__init__orig = backend_Function.__init__
 backend_Function.__init__ = _Function__init__
 
 
+# Leak checking can be disabled, e.g. for quick local runs, by setting the
+# TLM_ADJOINT_FAST_TESTS environment variable to a non-zero value
+_fast_tests = os.environ.get("TLM_ADJOINT_FAST_TESTS", "0") != "0"
+
+
 @pytest.fixture
 def test_leaks():
     function_ids.clear()
 
     yield
 
+    if _fast_tests:
+        function_ids.clear()
+        return
+
     gc.collect()
 
     # Clear some internal storage that is allowed to keep references
@@ -573,8 +573,7 @@ def test_AssembleSolver(setup_test, test_leaks):
 def test_Storage(setup_test, test_leaks):
     comm = manager().comm()
     if comm.rank == 0:
-        if not os.path.exists("checkpoints~"):
-            os.mkdir("checkpoints~")
+        os.makedirs("checkpoints~", exist_ok=True)
     comm.barrier()
 
     mesh = UnitSquareMesh(20, 20)
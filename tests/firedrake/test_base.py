@@ -34,6 +34,8 @@ import weakref
 
 __all__ = \
     [
+        "cached_function_space",
+        "cached_mesh",
         "interpolate_expression",
 
         "run_example",
@@ -125,12 +127,21 @@ _Function__init__orig = backend_Function.__init__
 backend_Function.__init__ = _Function__init__
 
 
+# Leak checking can be disabled, e.g. for quick local runs, by setting the
+# TLM_ADJOINT_FAST_TESTS environment variable to a non-zero value
+_fast_tests = os.environ.get("TLM_ADJOINT_FAST_TESTS", "0") != "0"
+
+
 @pytest.fixture
 def test_leaks():
     function_ids.clear()
 
     yield
 
+    if _fast_tests:
+        function_ids.clear()
+        return
+
     gc.collect()
 
     # Clear some internal storage that is allowed to keep references
@@ -174,6 +185,28 @@ def interpolate_expression(F, ex):
     F.interpolate(ex)
 
 
+# Meshes and function spaces are shared between tests, so that they, and
+# kernels compiled for them, are reused
+_mesh_cache = {}
+_space_cache = {}
+
+
+def cached_mesh(mesh_cls, *args):
+    key = (mesh_cls, args)
+    mesh = _mesh_cache.get(key, None)
+    if mesh is None:
+        mesh = _mesh_cache[key] = mesh_cls(*args)
+    return mesh
+
+
+def cached_function_space(mesh, family, degree):
+    key = (mesh, family, degree)
+    space = _space_cache.get(key, None)
+    if space is None:
+        space = _space_cache[key] = FunctionSpace(mesh, family, degree)
+    return space
+
+
 ls_parameters_cg = {"ksp_type": "cg",
                     "pc_type": "sor",
                     "ksp_rtol": 1.0e-14,